@@ -54,6 +54,12 @@ class SegmentationBackend(ModeEnum):
     CUSTOM = "custom"  # callable function
 
 
+@unique
+class SegmentationDevice(ModeEnum):
+    CPU = "cpu"
+    GPU = "gpu"
+
+
 @unique
 class BlobModel(ModeEnum):
     LOG = "log"
@@ -401,7 +401,7 @@ class FeatureMixin:
             tmp_features = skimage.measure.regionprops_table(
                 label_arr_0,
                 intensity_image=self[intensity_layer].sel(z=library_id)[..., c].values,
-                properties=props,
+                properties=intensity_props,
             )
             for p in intensity_props:
                 features[f"{feature_name}_ch-{c}_{p}_mean"] = np.mean(tmp_features[p])
@@ -11,23 +11,52 @@ from typing import (
     Union,  # noqa: F401
 )
 
+import dask
 import dask.array as da
 import numpy as np
+from numba import njit
 from scanpy import logging as logg
 from scipy import ndimage as ndi
 from skimage.feature import peak_local_max
 from skimage.filters import threshold_otsu
 from skimage.segmentation import watershed
 
-from squidpy._constants._constants import SegmentationBackend
+from squidpy._constants._constants import SegmentationBackend, SegmentationDevice
 from squidpy._constants._pkg_constants import Key
 from squidpy._docs import d, inject_docs
-from squidpy._utils import NDArrayA, singledispatchmethod
+from squidpy._utils import NDArrayA, _get_n_cores, singledispatchmethod
 from squidpy.im._container import ImageContainer
 
 __all__ = ["SegmentationModel", "SegmentationWatershed", "SegmentationCustom"]
 _SEG_DTYPE = np.uint32
 _SEG_DTYPE_N_BITS = _SEG_DTYPE(0).nbytes * 8
+_PEAK_FOOTPRINT = np.ones((5, 5), dtype=np.bool_)
+
+
+def _distance_transform(mask: NDArrayA, use_cv2: bool = False) -> NDArrayA:
+    """Compute the euclidean distance of foreground pixels in ``mask`` to the nearest background pixel."""
+    if use_cv2 and not mask.all():  # without background pixels, OpenCV returns huge sentinel values
+        try:
+            import cv2
+        except ImportError as e:
+            raise ImportError(f"Unable to compute the distance transform using `cv2`. Reason: `{e}`.") from None
+        # rounding differs from :mod:`scipy`, which can break ties in the peak finding differently
+        return cv2.distanceTransform(  # type: ignore[no-any-return]
+            mask.astype(np.uint8, copy=False),
+            distanceType=cv2.DIST_L2,
+            maskSize=cv2.DIST_MASK_PRECISE,
+            dstType=cv2.CV_32F,
+        )
+    # single precision is enough for the peak finding and the flooding
+    return ndi.distance_transform_edt(mask).astype(np.float32, copy=False)  # type: ignore[no-any-return]
+
+
+# not using `parallel=True`, since this is called concurrently from `dask`'s threads
+@njit(cache=True, nogil=True)
+def _shift_labels(labels: NDArrayA, shift: int, block_num: int) -> None:
+    for i in range(labels.shape[0]):
+        if labels[i] > 0:
+            labels[i] = (labels[i] << shift) | block_num
 
 
 class SegmentationModel(ABC):
@@ -200,9 +229,9 @@ class SegmentationModel(ABC):
         else:
             raise ValueError(f"Expected either `2`, `3` or `4` dimensional chunks, found `{len(num_blocks)}`.")
 
-        labels = self._segment(block, **kwargs).astype(_SEG_DTYPE)
-        mask: NDArrayA = labels > 0
-        labels[mask] = (labels[mask] << shift) | block_num
+        # C-order guarantees that `reshape` returns a view which is modified in-place
+        labels = self._segment(block, **kwargs).astype(_SEG_DTYPE, order="C")
+        _shift_labels(labels.reshape(-1), shift, block_num)
 
         return labels
 
@@ -214,7 +243,11 @@ class SegmentationModel(ABC):
 
 
 class SegmentationWatershed(SegmentationModel):
-    """Segmentation model based on :mod:`skimage` watershed segmentation."""
+    """
+    Segmentation model based on :mod:`skimage` watershed segmentation.
+
+    The distance transform is computed using :mod:`scipy`, or using :mod:`cv2` if ``use_cv2 = True``.
+    """
 
     def __init__(self) -> None:
         super().__init__(model=None)
@@ -224,20 +257,52 @@ class SegmentationWatershed(SegmentationModel):
         arr: NDArrayA,
         thresh: float | None = None,
         geq: bool = True,
+        device: str = SegmentationDevice.CPU.s,
+        use_cv2: bool = False,
         **kwargs: Any,
     ) -> NDArrayA | da.Array:
         arr = arr.squeeze(-1)  # we always pass a 3D image
+        if SegmentationDevice(device) == SegmentationDevice.GPU:
+            return self._segment_gpu(arr, thresh=thresh, geq=geq)
+
         if thresh is None:
             thresh = threshold_otsu(arr)
-        mask: NDArrayA = (arr >= thresh) if geq else (arr < thresh)
-        distance = ndi.distance_transform_edt(mask)
-        coords = peak_local_max(distance, footprint=np.ones((5, 5)), labels=mask)
+        mask = ((arr >= thresh) if geq else (arr < thresh)).view(np.uint8)
+        distance = _distance_transform(mask, use_cv2=use_cv2)
+        coords = peak_local_max(distance, footprint=_PEAK_FOOTPRINT, labels=mask)
         local_maxi = np.zeros(distance.shape, dtype=np.bool_)
         local_maxi[tuple(coords.T)] = True
 
         markers, _ = ndi.label(local_maxi)
+        # distance is no longer needed, flood its negation without allocating a new array
+        np.negative(distance, out=distance)
+
+        return np.asarray(watershed(distance, markers, mask=mask))
+
+    @staticmethod
+    def _segment_gpu(arr: NDArrayA, thresh: float | None, geq: bool) -> NDArrayA:
+        try:
+            import cupy as cp
+            from cucim.core.operations.morphology import distance_transform_edt
+            from cucim.skimage.feature import peak_local_max as peak_local_max_gpu
+            from cucim.skimage.filters import threshold_otsu as threshold_otsu_gpu
+            from cupyx.scipy import ndimage as ndi_gpu
+        except ImportError as e:
+            raise ImportError(f"Unable to segment on the GPU. Reason: `{e}`.") from None
+
+        arr = cp.asarray(arr)
+        if thresh is None:
+            thresh = float(threshold_otsu_gpu(arr))
+        mask = ((arr >= thresh) if geq else (arr < thresh)).astype(cp.uint8)
+        distance = distance_transform_edt(mask)
+        coords = peak_local_max_gpu(distance, footprint=cp.asarray(_PEAK_FOOTPRINT), labels=mask)
+        local_maxi = cp.zeros(distance.shape, dtype=cp.bool_)
+        local_maxi[tuple(coords.T)] = True
+
+        markers, _ = ndi_gpu.label(local_maxi)
 
-        return np.asarray(watershed(-distance, markers, mask=mask))
+        # :mod:`cucim` does not implement the flooding, it's done on the CPU
+        return np.asarray(watershed(-cp.asnumpy(distance), cp.asnumpy(markers), mask=cp.asnumpy(mask)))
 
 
 class SegmentationCustom(SegmentationModel):
@@ -268,7 +333,7 @@ class SegmentationCustom(SegmentationModel):
 
 
 @d.dedent
-@inject_docs(m=SegmentationBackend)
+@inject_docs(m=SegmentationBackend, dev=SegmentationDevice)
 def segment(
     img: ImageContainer,
     layer: str | None = None,
@@ -279,6 +344,7 @@ def segment(
     lazy: bool = False,
     layer_added: str | None = None,
     copy: bool = False,
+    n_jobs: int | None = None,
     **kwargs: Any,
 ) -> ImageContainer | None:
     """
@@ -308,7 +374,23 @@ def segment(
         Treat ``thresh`` as upper or lower bound for defining areas to segment. If ``geq = True``, mask is defined
         as ``mask = arr >= thresh``, meaning high values in ``arr`` denote areas to segment.
         Only used if ``method = {m.WATERSHED.s!r}``.
+    device
+        Device on which to compute the distance transform and the markers. Valid options are:
+
+            - `{dev.CPU.s!r}` - use :mod:`scipy` and :mod:`skimage`.
+            - `{dev.GPU.s!r}` - use :mod:`cucim`, requires `cuCIM <https://github.com/rapidsai/cucim>`_ to be installed.
+
+        Only used if ``method = {m.WATERSHED.s!r}``.
+    use_cv2
+        Whether to compute the distance transform using :mod:`cv2`, which is faster than :mod:`scipy`, but its
+        rounding can break ties between the markers differently, resulting in a slightly different segmentation.
+        Only used if ``method = {m.WATERSHED.s!r}`` and ``device = {dev.CPU.s!r}``.
     %(copy_cont)s
+    n_jobs
+        Number of parallel jobs used to segment the :mod:`dask` chunks. If `None`, use :mod:`dask`'s default.
+        Only used when ``chunks != None`` and ``lazy = False``. If not `None`, the chunks are computed using
+        :mod:`dask`'s ``'threads'`` scheduler, even if a :mod:`dask.distributed` client is active.
+        It is also passed to the ``method``, as part of ``kwargs``.
     %(segment_kwargs)s
 
     Returns
@@ -323,6 +405,8 @@ def segment(
     kind = SegmentationBackend.CUSTOM if callable(method) else SegmentationBackend(method)
     layer_new = Key.img.segment(kind, layer_added=layer_added)
     kwargs["chunks"] = chunks
+    if n_jobs is not None:
+        kwargs["n_jobs"] = n_jobs
     library_id = img._get_library_ids(library_id)
 
     if not isinstance(method, SegmentationModel):
@@ -340,18 +424,21 @@ def segment(
     if TYPE_CHECKING:
         assert isinstance(method, SegmentationModel)
 
+    # chunks are independent, segment them in parallel when computing the result
+    config = {} if n_jobs is None else {"scheduler": "threads", "num_workers": _get_n_cores(n_jobs)}
     start = logg.info(f"Segmenting an image of shape `{img[layer].shape}` using `{method}`")
-    res: ImageContainer = method.segment(
-        img,
-        layer=layer,
-        channel=channel,
-        library_id=library_id,
-        chunks=None,
-        fn_kwargs=kwargs,
-        copy=True,
-        drop=copy,
-        lazy=lazy,
-    )
+    with dask.config.set(config):
+        res: ImageContainer = method.segment(
+            img,
+            layer=layer,
+            channel=channel,
+            library_id=library_id,
+            chunks=None,
+            fn_kwargs=kwargs,
+            copy=True,
+            drop=copy,
+            lazy=lazy,
+        )
     logg.info("Finish", time=start)
 
     if copy:
@@ -104,6 +104,7 @@ def extract(
     adata: AnnData,
     obsm_key: list[str] | str = "img_features",
     prefix: list[str] | str | None = None,
+    copy: bool = True,
 ) -> AnnData:
     """
     Create a temporary :class:`anndata.AnnData` object for plotting.
@@ -119,10 +120,14 @@ def extract(
     prefix
         Prefix to prepend to each column name. Should be a :class;`list` if ``obsm_key`` is a :class:`list`.
         If `None`, use the original column names.
+    copy
+        Whether to copy ``adata`` or to modify its :attr:`anndata.AnnData.obs` in-place.
+        The extracted columns are copied into :attr:`anndata.AnnData.obs` in either case.
 
     Returns
     -------
-    Temporary :class:`anndata.AnnData` object with desired entries in :attr:`anndata.AnnData.obs`.
+    If ``copy = True``, temporary :class:`anndata.AnnData` object with desired entries in
+    :attr:`anndata.AnnData.obs`. Otherwise, ``adata`` with the modified :attr:`anndata.AnnData.obs`.
 
     Raises
     ------
@@ -159,22 +164,31 @@ def extract(
         prefix = ["" for _ in obsm_key]
 
     # create tmp_adata and copy obsm columns
-    tmp_adata = adata.copy()
+    tmp_adata = adata.copy() if copy else adata
+    obs: dict[str, Any] = {}
     for i, cur_obsm_key in enumerate(obsm_key):
         obsm = adata.obsm[cur_obsm_key]
         if isinstance(obsm, pd.DataFrame):
             # names will be column_names
-            for col in obsm.columns:
-                obs_key = f"{prefix[i]}{col}"
-                _warn_if_exists_obs(tmp_adata, obs_key)
-                tmp_adata.obs[obs_key] = obsm[col]
+            # `anndata` ensures the index matches `adata.obs_names`, no need to align
+            # `.array` also keeps extension dtypes, such as categoricals
+            columns = {f"{prefix[i]}{col}": obsm[col].array for col in obsm.columns}
         else:
             # names will be integer indices
-            for j in range(obsm.shape[1]):
-                obs_key = f"{prefix[i]}{j}"
+            columns = {f"{prefix[i]}{j}": obsm[:, j] for j in range(obsm.shape[1])}
+        for obs_key in columns:
+            if obs_key in obs:
+                logg.warning(f"Overwriting `adata.obs[{obs_key!r}]`")
+            else:
                 _warn_if_exists_obs(tmp_adata, obs_key)
-                # https://github.com/scverse/squidpy/issues/646
-                tmp_adata.obs[obs_key] = pd.Series(obsm[:, j], index=tmp_adata.obs_names)
+        obs.update(columns)
+
+    # add all columns at once, setting them one by one is slow for many columns
+    # overwritten columns keep their position, new ones are appended
+    order = list(tmp_adata.obs.columns) + [c for c in obs if c not in tmp_adata.obs.columns]
+    tmp_adata.obs = pd.concat(
+        [tmp_adata.obs.drop(columns=list(obs), errors="ignore"), pd.DataFrame(obs, index=tmp_adata.obs_names)], axis=1
+    )[order]
 
     return tmp_adata
 
@@ -468,10 +482,20 @@ def _contrasting_color(r: int, g: int, b: int) -> str:
     return "#000000" if r * 0.299 + g * 0.587 + b * 0.114 > 186 else "#ffffff"
 
 
-def _get_black_or_white(value: float, cmap: mcolors.Colormap) -> str:
+def _get_black_or_white_lut(cmap: mcolors.Colormap) -> NDArrayA:
+    # same luminance criterion as in `_contrasting_color`, for each color in the `cmap`
+    r, g, b = (cmap(np.arange(cmap.N))[:, :3] * 255).astype(np.int32).T
+    return np.where(r * 0.299 + g * 0.587 + b * 0.114 > 186, "#000000", "#ffffff")
+
+
+def _get_black_or_white(value: float, cmap: mcolors.Colormap, lut: NDArrayA | None = None) -> str:
     if not (0.0 <= value <= 1.0):
         raise ValueError(f"Value must be in range `[0, 1]`, found `{value}`.")
 
+    if lut is not None:
+        # same binning as in `matplotlib.colors.Colormap.__call__`
+        return str(lut[min(int(value * cmap.N), cmap.N - 1)])
+
     r, g, b, *_ = (int(c * 255) for c in cmap(value))
     return _contrasting_color(r, g, b)
 
@@ -492,12 +516,13 @@ def _annotate_heatmap(
     if TYPE_CHECKING:
         assert callable(valfmt)
 
+    lut = _get_black_or_white_lut(cmap)
     for i in range(data.shape[0]):
         for j in range(data.shape[1]):
             val = im.norm(data[i, j])
             if np.isnan(val):
                 continue
-            kw.update(color=_get_black_or_white(val, cmap))
+            kw.update(color=_get_black_or_white(val, cmap, lut=lut))
             im.axes.text(j, i, valfmt(data[i, j], None), **kw)
 
 
@@ -4,6 +4,7 @@ import dask.array as da
 import numpy as np
 import pytest
 from pytest_mock import MockerFixture
+from scipy import ndimage as ndi
 from squidpy._constants._constants import SegmentationBackend
 from squidpy._constants._pkg_constants import Key
 from squidpy.im import (
@@ -12,7 +13,7 @@ from squidpy.im import (
     SegmentationWatershed,
     segment,
 )
-from squidpy.im._segment import _SEG_DTYPE
+from squidpy.im._segment import _SEG_DTYPE, _distance_transform
 
 
 def dummy_segment(arr: np.ndarray) -> np.ndarray:
@@ -76,6 +77,75 @@ class TestWatershed:
 
         assert call[1]["thresh"] == thresh
 
+    def test_gpu_device(self, small_cont: ImageContainer):
+        pytest.importorskip("cucim")
+        thresh = float(np.median(small_cont["image"].values[..., 0]))
+        res_cpu = segment(small_cont, layer="image", device="cpu", thresh=thresh, copy=True)
+        res_gpu = segment(small_cont, layer="image", device="gpu", thresh=thresh, copy=True)
+        res_cpu = res_cpu[Key.img.segment("watershed")].values
+        res_gpu = res_gpu[Key.img.segment("watershed")].values
+
+        # distances can be rounded differently, which breaks ties differently, compare only the coverage
+        assert np.mean((res_cpu > 0) == (res_gpu > 0)) > 0.99
+        n_cpu, n_gpu = len(np.unique(res_cpu)), len(np.unique(res_gpu))
+        assert abs(n_cpu - n_gpu) <= 0.25 * n_cpu
+
+    @pytest.mark.parametrize("dtype", [np.uint8, ">u2", np.float16, np.float32, ">f8"])
+    def test_dtype(self, dtype: str):
+        img = np.zeros((50, 60, 1), dtype=dtype)
+        img[5:20, 10:40] = 1
+        img[30:45, 2:12] = 1
+
+        res = SegmentationWatershed().segment(img, thresh=0.5)
+
+        assert res.dtype == _SEG_DTYPE
+        np.testing.assert_array_equal(res[..., 0] > 0, img[..., 0] > 0)
+
+    def test_invalid_device(self):
+        img = np.zeros((10, 10, 1), dtype=np.float64)
+
+        with pytest.raises(ValueError, match=r"Invalid option `foo` for `SegmentationDevice`"):
+            SegmentationWatershed().segment(img, device="foo")
+
+    @pytest.mark.parametrize("all_foreground", [False, True])
+    def test_distance_transform_cv2(self, all_foreground: bool):
+        pytest.importorskip("cv2")
+        mask = np.zeros((50, 60), dtype=np.bool_)
+        mask[5:20, 10:40] = True
+        mask[30:45, 2:12] = True
+        if all_foreground:
+            mask[:] = True
+
+        res = _distance_transform(mask, use_cv2=True)
+
+        assert res.shape == mask.shape
+        assert res.dtype == np.float32
+        np.testing.assert_allclose(res, ndi.distance_transform_edt(mask), rtol=1e-5, atol=1e-5)
+
+    def test_watershed_cv2(self):
+        pytest.importorskip("cv2")
+        rng = np.random.RandomState(42)
+        img = ndi.gaussian_filter(rng.uniform(size=(256, 256)), sigma=4)[..., np.newaxis]
+        thresh = np.median(img)
+        sw = SegmentationWatershed()
+
+        res_scipy = sw.segment(img, thresh=thresh)
+        res_cv2 = sw.segment(img, thresh=thresh, use_cv2=True)
+
+        # ties in the distance transform can be broken differently, which changes the individual segments
+        assert np.mean((res_cv2 > 0) == (res_scipy > 0)) > 0.99
+        n_scipy, n_cv2 = len(np.unique(res_scipy)), len(np.unique(res_cv2))
+        assert abs(n_scipy - n_cv2) <= 0.25 * n_scipy
+
+    @pytest.mark.parametrize("size", [30, 110])
+    def test_watershed_cv2_all_foreground(self, size: int):
+        pytest.importorskip("cv2")
+        img = np.ones((size, size, 1), dtype=np.float64)
+
+        res = SegmentationWatershed().segment(img, thresh=0.5, use_cv2=True)
+
+        np.testing.assert_array_equal(res, SegmentationWatershed().segment(img, thresh=0.5))
+
 
 class TestHighLevel:
     def test_invalid_layer(self, small_cont: ImageContainer):
@@ -184,18 +254,28 @@ class TestHighLevel:
         assert set(small_cont) == prev_keys
         assert Key.img.segment("watershed") in res
 
-    def test_parallelize(self, small_cont: ImageContainer):
-        res1 = segment(small_cont, layer="image", n_jobs=1, copy=True)
-        res2 = segment(small_cont, layer="image", n_jobs=2, copy=True)
+    def test_n_jobs_passed_to_method(self, small_cont: ImageContainer):
+        def func(arr: np.ndarray, n_jobs: Optional[int] = None):
+            assert n_jobs == 3, "`n_jobs` not passed."
+            return np.zeros(arr[..., 0].shape, dtype=_SEG_DTYPE)
+
+        segment(small_cont, method=func, layer="image", layer_added="bar", n_jobs=3)
+        np.testing.assert_array_equal(small_cont["bar"].values, 0)
+
+    @pytest.mark.parametrize("chunks", [None, 25])
+    def test_parallelize(self, small_cont: ImageContainer, chunks: Optional[int]):
+        res1 = segment(small_cont, layer="image", n_jobs=1, chunks=chunks, copy=True)
+        res2 = segment(small_cont, layer="image", n_jobs=2, chunks=chunks, copy=True)
 
         np.testing.assert_array_equal(
             res1[Key.img.segment("watershed")].values, res2[Key.img.segment("watershed")].values
         )
 
     @pytest.mark.parametrize("chunks", [25, 50])
-    def test_blocking(self, small_cont: ImageContainer, chunks: int):
+    @pytest.mark.parametrize("order", ["C", "F"])
+    def test_blocking(self, small_cont: ImageContainer, chunks: int, order: str):
         def func(chunk: np.ndarray):
-            labels = np.zeros(chunk[..., 0].shape, dtype=np.uint32)
+            labels = np.zeros(chunk[..., 0].shape, dtype=np.uint32, order=order)
             labels[0, 0] = 1
             return labels
 
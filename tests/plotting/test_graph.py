@@ -7,7 +7,9 @@ import pandas as pd
 import pytest
 import scanpy as sc
 from anndata import AnnData
+from matplotlib.colors import Colormap, ListedColormap
 from squidpy import gr, pl
+from squidpy.pl._utils import _get_black_or_white, _get_black_or_white_lut
 
 from tests.conftest import DPI, PlotTester, PlotTesterMeta
 
@@ -206,3 +208,14 @@ class TestLigrec(PlotTester, metaclass=PlotTesterMeta):
 
     def test_plot_remove_nonsig_interactions(self, ligrec_result: Mapping[str, pd.DataFrame]):
         pl.ligrec(ligrec_result, remove_nonsig_interactions=True, alpha=1e-4)
+
+
+@pytest.mark.parametrize(
+    "cmap",
+    [plt.get_cmap("viridis"), ListedColormap(["black", "white", "yellow", "navy", "#bbbbbb", "#ba0000", "lime"])],
+)
+def test_black_or_white_lut(cmap: Colormap):
+    lut = _get_black_or_white_lut(cmap)
+
+    for value in np.linspace(0, 1, 1001):
+        assert _get_black_or_white(value, cmap, lut=lut) == _get_black_or_white(value, cmap)
@@ -114,3 +114,38 @@ def test_extract(adata: AnnData, cont: ImageContainer, caplog, is_view: bool):
         "2",
     ]:
         np.testing.assert_array_equal(np.isfinite(extr_adata.obs[col]), True)
+
+
+def test_extract_inplace(adata: AnnData):
+    adata.obsm["pca_features"] = np.random.RandomState(0).normal(size=(adata.n_obs, 3))
+
+    res = sq.pl.extract(adata, obsm_key="pca_features", prefix="pca", copy=False)
+
+    assert res is adata
+    for j in range(3):
+        np.testing.assert_array_equal(adata.obs[f"pca_{j}"], adata.obsm["pca_features"][:, j])
+
+
+def test_extract_keeps_dtype(adata: AnnData):
+    cats = pd.Categorical(np.where(np.arange(adata.n_obs) % 2, "a", "b"))
+    adata.obsm["df"] = pd.DataFrame(
+        {"cat": cats, "int": pd.array(np.arange(adata.n_obs), dtype="Int64")}, index=adata.obs_names
+    )
+
+    res = sq.pl.extract(adata, obsm_key="df")
+
+    assert isinstance(res.obs["cat"].dtype, pd.CategoricalDtype)
+    np.testing.assert_array_equal(res.obs["cat"].values, cats)
+    assert res.obs["int"].dtype == "Int64"
+
+
+def test_extract_keeps_column_order(adata: AnnData):
+    adata.obsm["pca_features"] = np.random.RandomState(0).normal(size=(adata.n_obs, 2))
+    adata.obs["pca_0"] = 0.0
+    adata.obs["foo"] = 1.0
+    columns = list(adata.obs.columns)
+
+    res = sq.pl.extract(adata, obsm_key="pca_features", prefix="pca")
+
+    assert list(res.obs.columns) == columns + ["pca_1"]
+    np.testing.assert_array_equal(res.obs["pca_0"], adata.obsm["pca_features"][:, 0])